@@ -2,7 +2,16 @@
 Configuration package for Document AI Agent
 """
 
-from .settings import settings, Settings, EmbeddingProvider, LLMProvider
+from .settings import Settings, EmbeddingProvider, LLMProvider, ChunkSizeUnit, get_settings
 
-__all__ = ["settings", "Settings", "EmbeddingProvider", "LLMProvider"]
+# Importing the submodule implicitly binds `config.settings` to it; drop that
+# binding so the name resolves lazily to the Settings instance below
+globals().pop("settings")
 
+__all__ = ["settings", "Settings", "EmbeddingProvider", "LLMProvider", "ChunkSizeUnit", "get_settings"]
+
+
+def __getattr__(name: str):
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,9 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List, Optional
 from enum import Enum
+from functools import lru_cache, cached_property
+import os
+from dotenv import load_dotenv
 
 class EmbeddingProvider(str, Enum):
     OPENAI = "openai"
@@ -12,6 +15,16 @@ class LLMProvider(str, Enum):
     ANTHROPIC = "anthropic"
     LOCAL = "local"
 
+class ChunkSizeUnit(str, Enum):
+    CHARACTERS = "characters"
+    TOKENS = "tokens"
+
+def _lazy_secret(env_var: str) -> cached_property:
+    """Secret read from the environment on first access, then cached"""
+    def resolve(self) -> Optional[str]:
+        return os.environ.get(env_var) or None
+    return cached_property(resolve)
+
 class Settings(BaseSettings):
     # Application
     APP_NAME: str = "Document AI Agent with LangChain"
@@ -23,29 +36,49 @@ class Settings(BaseSettings):
     LLM_PROVIDER: LLMProvider = LLMProvider.OPENAI
     
     # API Keys (use environment variables)
-    OPENAI_API_KEY: Optional[str] = None
-    ANTHROPIC_API_KEY: Optional[str] = None
-    HUGGINGFACEHUB_API_TOKEN: Optional[str] = None
+    # Resolved lazily so only the provider actually in use is looked up
+    OPENAI_API_KEY = _lazy_secret("OPENAI_API_KEY")
+    ANTHROPIC_API_KEY = _lazy_secret("ANTHROPIC_API_KEY")
+    HUGGINGFACEHUB_API_TOKEN = _lazy_secret("HUGGINGFACEHUB_API_TOKEN")
     
     # Model Settings
     EMBEDDING_MODEL: str = "sentence-transformers/all-mpnet-base-v2"
+    EMBEDDING_CACHE_DIRECTORY: str = "./data/emb_cache"
+    EMBEDDING_DEVICE: Optional[str] = None  # cpu, cuda or mps; auto-detected when unset
+    EMBEDDING_FUZZY_CACHE_THRESHOLD: Optional[float] = None  # e.g. 0.9 to reuse near-duplicate embeddings
     LLM_MODEL: str = "gpt-3.5-turbo"
     
     # Vector Store
     VECTOR_STORE: str = "chroma"
     PERSIST_DIRECTORY: str = "./data/vector_store"
+    FAISS_SCALAR_QUANTIZATION: bool = False  # Store new FAISS indexes as int8 codes
+    
+    # Conversation Memory
+    MEMORY_MAX_TOKENS: int = 1500
     
     # Text Splitting
     CHUNK_SIZE: int = 1000
     CHUNK_OVERLAP: int = 200
+    CHUNK_SIZE_UNIT: ChunkSizeUnit = ChunkSizeUnit.CHARACTERS
+    TOKEN_ENCODING: str = "cl100k_base"
     
     # File Processing
     UPLOAD_DIRECTORY: str = "./data/uploads"
     MAX_FILE_SIZE: int = 100 * 1024 * 1024  # 100MB
     
+    # .env is loaded into os.environ once by get_settings(), not per instance
     model_config = SettingsConfigDict(
-        env_file=".env",
         extra="ignore"  # Ignore extra environment variables
     )
 
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings singleton on first use and cache it"""
+    load_dotenv()  # Existing environment variables take precedence
+    return Settings()
+
+def __getattr__(name: str):
+    # Resolve `settings` lazily so importing this module doesn't parse .env
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,21 @@
 import streamlit as st
 import requests
+import orjson
+from requests.adapters import HTTPAdapter
+from requests_toolbelt.multipart.encoder import MultipartEncoder
 import os
 from typing import List, Dict
 
+API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000").rstrip("/")
+REQUEST_TIMEOUT = (3.05, 60)  # (connect, read) seconds
+
+# Shared keep-alive session so each request reuses pooled connections
+SESSION = requests.Session()
+SESSION.headers["Connection"] = "keep-alive"
+ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+SESSION.mount("http://", ADAPTER)
+SESSION.mount("https://", ADAPTER)
+
 st.set_page_config(
     page_title="Document AI Agent with LangChain",
     layout="wide",
@@ -85,14 +98,20 @@ def process_uploaded_files(uploaded_files):
     st.session_state.processing = True
     
     with st.spinner("Processing documents..."):
-        files = []
+        # Stream the file handles instead of copying every file into memory
         for uploaded_file in uploaded_files:
-            files.append(("files", (uploaded_file.name, uploaded_file.getvalue(), uploaded_file.type)))
+            uploaded_file.seek(0)
+        encoder = MultipartEncoder(fields=[
+            ("files", (uploaded_file.name, uploaded_file, uploaded_file.type))
+            for uploaded_file in uploaded_files
+        ])
         
         try:
-            response = requests.post(
-                "http://localhost:8000/upload/",
-                files=files
+            response = SESSION.post(
+                f"{API_BASE_URL}/upload/",
+                data=encoder,
+                headers={"Content-Type": encoder.content_type},
+                timeout=REQUEST_TIMEOUT
             )
             
             if response.status_code == 200:
@@ -108,16 +127,18 @@ def get_answer(question: str, use_conversation: bool):
     """Get answer from AI agent"""
     with st.spinner("Searching documents..."):
         try:
-            response = requests.post(
-                "http://localhost:8000/query/",
-                json={
+            response = SESSION.post(
+                f"{API_BASE_URL}/query/",
+                data=orjson.dumps({
                     "question": question,
                     "use_conversation": use_conversation
-                }
+                }),
+                headers={"Content-Type": "application/json"},
+                timeout=REQUEST_TIMEOUT
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 
                 # Add to chat history
                 st.session_state.chat_history.append({
@@ -138,19 +159,30 @@ def get_answer(question: str, use_conversation: bool):
 
 def display_chat_history():
     """Display chat history"""
-    for i, chat in enumerate(reversed(st.session_state.chat_history[-5:])):
+    for i, chat in enumerate(st.session_state.chat_history[-1:-6:-1]):
         with st.expander(f"Q: {chat['question'][:50]}...", expanded=i==0):
             st.write(f"**Answer:** {chat['answer']}")
             st.caption(f"Processing time: {chat['processing_time']:.2f}s")
 
+@st.cache_data(show_spinner=False)
+def _prepare_sources(sources: tuple) -> List[Dict]:
+    """Build the render-ready source entries once per response"""
+    return [
+        {
+            "title": f"Source {i+1}: {source['source']}",
+            "content": source['content'],
+            "page": source.get('page')
+        }
+        for i, source in enumerate(sources)
+    ]
+
 def display_source_documents():
     """Display source documents in sidebar"""
     if hasattr(st.session_state, 'last_sources'):
-        sources = st.session_state.last_sources
-        for i, source in enumerate(sources):
-            with st.expander(f"Source {i+1}: {source['source']}", expanded=True):
-                st.write(source['content'])
-                if source.get('page'):
+        for source in _prepare_sources(tuple(st.session_state.last_sources)):
+            with st.expander(source["title"], expanded=True):
+                st.write(source["content"])
+                if source["page"]:
                     st.caption(f"Page: {source['page']}")
 
 def display_statistics():
@@ -161,7 +193,7 @@ def clear_conversation_history():
     """Clear conversation history"""
     st.session_state.chat_history = []
     try:
-        response = requests.post("http://localhost:8000/clear_memory/")
+        response = SESSION.post(f"{API_BASE_URL}/clear_memory/", timeout=REQUEST_TIMEOUT)
         if response.status_code == 200:
             st.success("Conversation memory cleared!")
     except:
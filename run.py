@@ -18,12 +18,22 @@ def main():
         if not os.getenv(var):
             print(f"Warning: {var} is not set in environment variables")
     
+    debug = os.getenv("DEBUG") == "True"
+    
+    # Each worker loads its own embedding model, FAISS index and caches, so
+    # documents ingested by one are invisible to the others. Run several only
+    # when they share state (Chroma); reload requires a single worker.
+    workers = 1 if debug else int(os.getenv("WORKERS", 1))
+    
     # Start the FastAPI server
     uvicorn.run(
         "src.api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True if os.getenv("DEBUG") == "True" else False,
+        reload=debug,
+        workers=workers,
+        loop="auto",  # uvloop when installed
+        http="auto",  # httptools when installed
         log_level="info"
     )
 
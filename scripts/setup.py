@@ -3,6 +3,7 @@
 Setup script for Document AI Agent
 """
 
+import importlib
 import os
 import subprocess
 import sys
@@ -20,6 +21,30 @@ def run_command(command, description):
         print(f"Error output: {e.stderr}")
         return False
 
+def preload_embedding_model():
+    """Download the sentence-transformers weights used by the configured provider"""
+    print("🚀 Downloading embedding model...")
+    try:
+        # Packages were just installed, and config/ lives in the project root
+        importlib.invalidate_caches()
+        sys.path.insert(0, str(Path.cwd()))
+        from config.settings import settings, EmbeddingProvider
+        
+        provider = settings.EMBEDDING_PROVIDER
+        if provider == EmbeddingProvider.OPENAI:
+            print("✅ OpenAI embeddings need no local model")
+            return True
+        
+        from sentence_transformers import SentenceTransformer
+        
+        cache_folder = "./models" if provider == EmbeddingProvider.LOCAL else None
+        SentenceTransformer(settings.EMBEDDING_MODEL, cache_folder=cache_folder)
+        print("✅ Downloading embedding model completed successfully")
+        return True
+    except Exception as e:
+        print(f"❌ Downloading embedding model failed: {e}")
+        return False
+
 def main():
     print("🔧 Setting up Document AI Agent with LangChain...")
     
@@ -48,6 +73,9 @@ def main():
         else:
             print("⚠️  No .env.example file found")
     
+    # Pre-download embedding weights so the first API request doesn't pay for it
+    preload_embedding_model()
+    
     print("🎉 Setup completed successfully!")
     print("\nNext steps:")
     print("1. Edit .env file with your API keys")
@@ -0,0 +1,48 @@
+"""
+Shared LLM construction for the agents
+"""
+
+from functools import lru_cache
+from typing import Optional
+from config.settings import settings, LLMProvider
+
+
+def api_key_for(provider: LLMProvider) -> Optional[str]:
+    """Return the configured API key for an LLM provider"""
+    if provider == LLMProvider.OPENAI:
+        return settings.OPENAI_API_KEY
+    if provider == LLMProvider.ANTHROPIC:
+        return settings.ANTHROPIC_API_KEY
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_llm(provider: LLMProvider, model: str, temperature: float, api_key: Optional[str]):
+    """Build an LLM client once per configuration and reuse it across agents"""
+    # Provider packages are imported only when selected to keep startup light
+    if provider == LLMProvider.OPENAI:
+        if not api_key:
+            raise ValueError("OpenAI API key required")
+        from langchain_openai import ChatOpenAI
+        return ChatOpenAI(
+            model=model,
+            temperature=temperature,
+            api_key=api_key
+        )
+    
+    elif provider == LLMProvider.ANTHROPIC:
+        if not api_key:
+            raise ValueError("Anthropic API key required")
+        from langchain_anthropic import ChatAnthropic
+        return ChatAnthropic(
+            model=model,
+            temperature=temperature,
+            api_key=api_key
+        )
+    
+    elif provider == LLMProvider.LOCAL:
+        from langchain_community.llms import HuggingFaceHub
+        return HuggingFaceHub(
+            repo_id=model,
+            model_kwargs={"temperature": temperature, "max_length": 512}
+        )
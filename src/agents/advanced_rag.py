@@ -5,6 +5,13 @@ from langchain.retrievers import (
 )
 from langchain.retrievers.document_compressors import LLMChainExtractor
 from langchain.retrievers.ensemble import FusionAlgorithm
+from pathlib import Path
+from loguru import logger
+import hashlib
+import pickle
+from src.vector_store.vector_store_manager import VectorStoreManager
+
+BM25_CACHE_DIR = Path("./data/cache")
 
 class AdvancedRAGSystem:
     def __init__(self, vector_store_manager: VectorStoreManager, llm):
@@ -25,8 +32,59 @@ class AdvancedRAGSystem:
     def _create_ensemble_retriever(self):
         """Create ensemble retriever combining multiple methods"""
         vector_retriever = self.vector_store_manager.as_retriever()
+        bm25_retriever = self._load_or_build_bm25_retriever()
+        
+        if bm25_retriever is None:
+            return EnsembleRetriever(
+                retrievers=[vector_retriever],
+                weights=[1.0]
+            )
         
         return EnsembleRetriever(
-            retrievers=[vector_retriever],
-            weights=[1.0]
-        )
\ No newline at end of file
+            retrievers=[vector_retriever, bm25_retriever],
+            weights=[0.5, 0.5]
+        )
+    
+    def _load_or_build_bm25_retriever(self):
+        """Load the BM25 index for the current corpus from disk, building it if missing"""
+        # Hash ids only; document contents are fetched just when a rebuild is needed
+        doc_ids = self.vector_store_manager.get_document_ids()
+        if not doc_ids:
+            return None
+        
+        corpus_hash = hashlib.blake2b(
+            b"\0".join(sorted(doc_id.encode() for doc_id in doc_ids)),
+            digest_size=16
+        ).hexdigest()
+        cache_path = BM25_CACHE_DIR / f"bm25_{corpus_hash}.pkl"
+        
+        if cache_path.exists():
+            try:
+                with open(cache_path, "rb") as f:
+                    return pickle.load(f)
+            except Exception as e:
+                logger.warning(f"Discarding unreadable BM25 cache {cache_path}: {e}")
+        
+        _, documents = self.vector_store_manager.get_all_documents()
+        if not documents:
+            return None
+        
+        bm25_retriever = BM25Retriever.from_documents(documents)
+        
+        try:
+            BM25_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                pickle.dump(bm25_retriever, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.error(f"Error saving BM25 cache {cache_path}: {e}")
+            return bm25_retriever
+        
+        # Each cache file holds a full copy of the corpus; keep only the current one
+        for stale_path in BM25_CACHE_DIR.glob("bm25_*.pkl"):
+            if stale_path != cache_path:
+                try:
+                    stale_path.unlink()
+                except OSError as e:
+                    logger.warning(f"Could not remove stale BM25 cache {stale_path}: {e}")
+        
+        return bm25_retriever
@@ -1,74 +1,54 @@
 from langchain.chains.retrieval_qa.base import RetrievalQA
 from langchain.chains.conversational_retrieval.base import ConversationalRetrievalChain
 from langchain.chains.llm import LLMChain
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_community.llms import HuggingFaceHub
 from langchain_core.prompts import PromptTemplate
-from langchain.memory import ConversationBufferMemory
+from langchain.memory import ConversationTokenBufferMemory
 from langchain_core.retrievers import BaseRetriever
 from typing import Dict, Any, List, Optional
-from config.settings import settings, LLMProvider
+from config.settings import settings
+from src.agents._llm_factory import get_llm, api_key_for
+from src.utils.query_cache import QueryCache, cached_query
+
+_QA_PROMPT_TEMPLATE = """Use the following pieces of context to answer the question at the end. If you don't know the answer, just say that you don't know, don't try to make up an answer.
+
+        Context: {context}
+
+        Question: {question}
+        
+        Answer: """
+
+_QA_PROMPT = PromptTemplate(
+    template=_QA_PROMPT_TEMPLATE,
+    input_variables=["context", "question"]
+)
 
 class LangChainAIAgent:
     def __init__(self, retriever: BaseRetriever):
         self.retriever = retriever
         self.llm = self._initialize_llm()
-        self.memory = ConversationBufferMemory(
+        # Bounded history keeps per-query prompt size from growing without limit
+        self.memory = ConversationTokenBufferMemory(
+            llm=self.llm,
             memory_key="chat_history",
-            return_messages=True
+            return_messages=True,
+            max_token_limit=settings.MEMORY_MAX_TOKENS
         )
         self.qa_chain = self._create_qa_chain()
         self.conversational_chain = self._create_conversational_chain()
+        self._query_cache = QueryCache(maxsize=256)
     
     def _initialize_llm(self):
         """Initialize LLM based on configuration"""
         provider = settings.LLM_PROVIDER
-        
-        if provider == LLMProvider.OPENAI:
-            if not settings.OPENAI_API_KEY:
-                raise ValueError("OpenAI API key required")
-            return ChatOpenAI(
-                model=settings.LLM_MODEL,
-                temperature=0.1,
-                openai_api_key=settings.OPENAI_API_KEY
-            )
-        
-        elif provider == LLMProvider.ANTHROPIC:
-            if not settings.ANTHROPIC_API_KEY:
-                raise ValueError("Anthropic API key required")
-            return ChatAnthropic(
-                model=settings.LLM_MODEL,
-                temperature=0.1,
-                anthropic_api_key=settings.ANTHROPIC_API_KEY
-            )
-        
-        elif provider == LLMProvider.LOCAL:
-            return HuggingFaceHub(
-                repo_id=settings.LLM_MODEL,
-                model_kwargs={"temperature": 0.1, "max_length": 512}
-            )
+        return get_llm(provider, settings.LLM_MODEL, 0.1, api_key_for(provider))
     
     def _create_qa_chain(self):
         """Create retrieval QA chain"""
-        prompt_template = """Use the following pieces of context to answer the question at the end. If you don't know the answer, just say that you don't know, don't try to make up an answer.
-
-        Context: {context}
-
-        Question: {question}
-        
-        Answer: """
-        
-        PROMPT = PromptTemplate(
-            template=prompt_template,
-            input_variables=["context", "question"]
-        )
-        
         return RetrievalQA.from_chain_type(
             llm=self.llm,
             chain_type="stuff",
             retriever=self.retriever,
-            chain_type_kwargs={"prompt": PROMPT},
+            chain_type_kwargs={"prompt": _QA_PROMPT},
             return_source_documents=True
         )
     
@@ -82,6 +62,7 @@ class LangChainAIAgent:
             verbose=True
         )
     
+    @cached_query
     def query(self, question: str, use_conversation: bool = False) -> Dict[str, Any]:
         """Query the document knowledge base"""
         if use_conversation:
@@ -96,5 +77,10 @@ class LangChainAIAgent:
         }
     
     def clear_memory(self):
-        """Clear conversation memory"""
-        self.memory.clear()
\ No newline at end of file
+        """Clear conversation memory and cached answers"""
+        self.memory.clear()
+        self.clear_query_cache()
+    
+    def clear_query_cache(self):
+        """Drop cached answers, e.g. after new documents are ingested"""
+        self._query_cache.clear()
\ No newline at end of file
@@ -1,11 +1,25 @@
 from langchain.agents import initialize_agent, Tool, AgentType
 from langchain.tools import BaseTool
+from langchain_core.prompts import PromptTemplate
+from langchain_core.output_parsers import StrOutputParser
 from typing import List, Dict, Any
 
+_SUMMARY_PROMPT = PromptTemplate.from_template(
+    """
+        Summarize the following document content related to: {query}
+        
+        Documents:
+        {content}
+        
+        Summary:
+        """
+)
+
 class DocumentAIAgentSystem:
     def __init__(self, langchain_agent: LangChainAIAgent, vector_store_manager: VectorStoreManager):
         self.langchain_agent = langchain_agent
         self.vector_store_manager = vector_store_manager
+        self._summary_chain = None
         self.tools = self._create_tools()
         self.agent = self._create_agent()
     
@@ -40,21 +54,18 @@ class DocumentAIAgentSystem:
             handle_parsing_errors=True
         )
     
+    def _get_summary_chain(self):
+        """Build the summary LCEL chain on first use"""
+        if self._summary_chain is None:
+            self._summary_chain = _SUMMARY_PROMPT | self.langchain_agent.llm | StrOutputParser()
+        return self._summary_chain
+    
     def _summarize_documents(self, query: str) -> str:
         """Summarize relevant documents"""
-        docs = self.vector_store_manager.similarity_search(query, k=3)
-        content = "\n\n".join([doc.page_content for doc in docs])
-        
-        summary_prompt = f"""
-        Summarize the following document content related to: {query}
-        
-        Documents:
-        {content}
-        
-        Summary:
-        """
+        docs = self.vector_store_manager.similarity_search_columns(query, k=3)
+        content = "\n\n".join(docs.contents)
         
-        return self.langchain_agent.llm.predict(summary_prompt)
+        return self._get_summary_chain().invoke({"query": query, "content": content})
     
     def run(self, input_text: str) -> Dict[str, Any]:
         """Run the agent with given input"""
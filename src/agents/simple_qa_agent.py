@@ -2,15 +2,29 @@
 Simplified QA Agent that works with LangChain 1.0+
 """
 
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_community.llms import HuggingFaceHub
 from langchain_core.prompts import PromptTemplate
 from langchain_core.retrievers import BaseRetriever
-from langchain_core.runnables import RunnablePassthrough
+from langchain_core.runnables import RunnableParallel, RunnablePassthrough
 from langchain_core.output_parsers import StrOutputParser
 from typing import Dict, Any, List, Optional
-from config.settings import settings, LLMProvider
+from operator import itemgetter
+from config.settings import settings
+from src.agents._llm_factory import get_llm, api_key_for
+from src.utils.query_cache import QueryCache, cached_query
+
+_QA_PROMPT_TEMPLATE = """Use the following pieces of context to answer the question at the end. 
+If you don't know the answer, just say that you don't know, don't try to make up an answer.
+
+Context: {context}
+
+Question: {question}
+
+Answer:"""
+
+_QA_PROMPT = PromptTemplate(
+    template=_QA_PROMPT_TEMPLATE,
+    input_variables=["context", "question"]
+)
 
 
 class SimpleQAAgent:
@@ -20,74 +34,58 @@ class SimpleQAAgent:
         self.retriever = retriever
         self.llm = self._initialize_llm()
         self.chain = self._create_chain()
+        self._query_cache = QueryCache(maxsize=256)
     
     def _initialize_llm(self):
         """Initialize LLM based on configuration"""
         provider = settings.LLM_PROVIDER
-        
-        if provider == LLMProvider.OPENAI:
-            if not settings.OPENAI_API_KEY:
-                raise ValueError("OpenAI API key required")
-            return ChatOpenAI(
-                model=settings.LLM_MODEL,
-                temperature=0.7,
-                api_key=settings.OPENAI_API_KEY
-            )
-        
-        elif provider == LLMProvider.ANTHROPIC:
-            if not settings.ANTHROPIC_API_KEY:
-                raise ValueError("Anthropic API key required")
-            return ChatAnthropic(
-                model=settings.LLM_MODEL,
-                temperature=0.7,
-                api_key=settings.ANTHROPIC_API_KEY
-            )
-        
-        elif provider == LLMProvider.LOCAL:
-            return HuggingFaceHub(
-                repo_id=settings.LLM_MODEL,
-                model_kwargs={"temperature": 0.7, "max_length": 512}
-            )
+        return get_llm(provider, settings.LLM_MODEL, 0.7, api_key_for(provider))
     
     def _create_chain(self):
         """Create LCEL chain for QA"""
-        prompt = PromptTemplate.from_template(
-            """Use the following pieces of context to answer the question at the end. 
-If you don't know the answer, just say that you don't know, don't try to make up an answer.
-
-Context: {context}
-
-Question: {question}
-
-Answer:"""
-        )
+        def format_docs(inputs):
+            return "\n\n".join(doc.page_content for doc in inputs["docs"])
         
-        def format_docs(docs):
-            return "\n\n".join(doc.page_content for doc in docs)
-        
-        chain = (
-            {"context": self.retriever | format_docs, "question": RunnablePassthrough()}
-            | prompt
+        answer_chain = (
+            {"context": format_docs, "question": itemgetter("question")}
+            | _QA_PROMPT
             | self.llm
             | StrOutputParser()
         )
         
+        # Retrieve once and feed the same documents to the prompt and the caller
+        chain = RunnableParallel(
+            docs=self.retriever,
+            question=RunnablePassthrough()
+        ).assign(answer=answer_chain)
+        
         return chain
     
+    @cached_query
     def query(self, question: str, use_conversation: bool = False) -> Dict[str, Any]:
         """Query the document knowledge base"""
-        # Get relevant documents
-        docs = self.retriever.invoke(question)
+        result = self.chain.invoke(question)
         
-        # Get answer from LLM
-        answer = self.chain.invoke(question)
+        return {
+            "answer": result["answer"],
+            "source_documents": result["docs"],
+        }
+    
+    @cached_query
+    async def aquery(self, question: str, use_conversation: bool = False) -> Dict[str, Any]:
+        """Async variant of query() that keeps the event loop free during I/O"""
+        result = await self.chain.ainvoke(question)
         
         return {
-            "answer": answer,
-            "source_documents": docs,
+            "answer": result["answer"],
+            "source_documents": result["docs"],
         }
     
     def clear_memory(self):
-        """Clear conversation memory (placeholder for compatibility)"""
-        pass  # Stateless for now
+        """Clear conversation memory and cached answers"""
+        self.clear_query_cache()
+    
+    def clear_query_cache(self):
+        """Drop cached answers, e.g. after new documents are ingested"""
+        self._query_cache.clear()
 
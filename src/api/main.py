@@ -1,13 +1,17 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.formparsers import MultiPartParser
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 import shutil
 import os
+import sys
+import asyncio
+import aiofiles
 from pathlib import Path
 import time
-import json
-from datetime import datetime
+import threading
+from uuid import uuid4
 
 from config.settings import settings
 from src.core.langchain_loader import LangChainDocumentProcessor
@@ -16,6 +20,8 @@ from src.embeddings.embedding_manager import EmbeddingManager
 from src.vector_store.vector_store_manager import VectorStoreManager
 from src.agents.simple_qa_agent import SimpleQAAgent
 from src.utils.file_cleanup import FileCleanupManager
+from src.utils.file_tracking import ProcessedFilesTracker
+from src.utils.sync_tasks import SyncTaskStore
 
 app = FastAPI(title=settings.APP_NAME, version=settings.VERSION)
 
@@ -33,6 +39,37 @@ vector_store_manager = VectorStoreManager(embedding_manager.get_embeddings())
 retriever = vector_store_manager.as_retriever(search_kwargs={"k": 4})
 ai_agent = SimpleQAAgent(retriever)
 cleanup_manager = FileCleanupManager(retention_days=30)  # Keep files for 30 days
+processor = LangChainDocumentProcessor()
+splitter = AdvancedTextSplitter()
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+# Size past which starlette spools an upload to disk (renamed in starlette 0.46)
+UPLOAD_SPOOL_MAX_SIZE = getattr(
+    MultiPartParser, "spool_max_size", getattr(MultiPartParser, "max_file_size", 1024 * 1024)
+)
+
+UPLOAD_DIR = Path(settings.UPLOAD_DIRECTORY)
+SUPPORTED_EXTENSIONS = frozenset(['.pdf', '.txt', '.docx', '.doc', '.md', '.csv', '.json'])
+LEGACY_TRACKING_FILENAME = ".processed_files.json"
+
+processed_files_tracker = ProcessedFilesTracker(
+    UPLOAD_DIR / ".processed_files.db",
+    legacy_json_path=UPLOAD_DIR / LEGACY_TRACKING_FILENAME
+)
+
+# Background sync state lives in the tracking database so any worker can answer a poll
+MAX_TRACKED_SYNC_TASKS = 100
+sync_task_store = SyncTaskStore(UPLOAD_DIR / ".processed_files.db", max_tasks=MAX_TRACKED_SYNC_TASKS)
+sync_lock = threading.Lock()
+
+@app.on_event("startup")
+async def warm_up_retriever():
+    """Load the embedding model and vector store index before the first query arrives"""
+    try:
+        await asyncio.to_thread(embedding_manager.get_embeddings().embed_query, "warmup")
+        await retriever.ainvoke("warmup")
+    except Exception as e:
+        print(f"Retriever warmup failed: {e}")
 
 class QueryRequest(BaseModel):
     question: str
@@ -53,24 +90,43 @@ class SyncResponse(BaseModel):
     failed_files: List[Dict[str, str]]
     processing_time: float
 
+class SyncTaskResponse(BaseModel):
+    task_id: str
+    status: str  # queued, running, completed or failed
+    result: Optional[SyncResponse] = None
+    error: Optional[str] = None
+
 @app.post("/upload/")
 async def upload_files(files: List[UploadFile] = File(...), background_tasks: BackgroundTasks = None):
     """Upload and process files"""
-    upload_dir = Path(settings.UPLOAD_DIRECTORY)
-    upload_dir.mkdir(exist_ok=True)
+    UPLOAD_DIR.mkdir(exist_ok=True)
     
-    saved_files = []
+    async def save_upload(file: UploadFile, file_path: Path):
+        if file.size is not None and file.size > UPLOAD_SPOOL_MAX_SIZE:
+            # Uploads past the parser's spool limit are already on disk; let the kernel copy them
+            await asyncio.to_thread(copy_spooled_upload, file.file, file_path)
+        else:
+            async with aiofiles.open(file_path, "wb") as buffer:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    await buffer.write(chunk)
+    
+    async def save_uploads(file_path: Path, uploads: List[UploadFile]):
+        # Same-named files are written one after another, so the last one wins
+        for file in uploads:
+            await save_upload(file, file_path)
     
+    uploads_by_path = {}
     for file in files:
-        file_path = upload_dir / file.filename
-        
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
-        saved_files.append(str(file_path))
+        uploads_by_path.setdefault(UPLOAD_DIR / file.filename, []).append(file)
+    
+    # Write distinct targets concurrently without blocking the event loop
+    await asyncio.gather(*(
+        save_uploads(file_path, uploads) for file_path, uploads in uploads_by_path.items()
+    ))
+    saved_files = [str(UPLOAD_DIR / file.filename) for file in files]
     
     if background_tasks:
-        background_tasks.add_task(process_documents, saved_files)
+        background_tasks.add_task(process_documents, [str(file_path) for file_path in uploads_by_path])
     
     return {"message": "Files uploaded and processing started", "files": saved_files}
 
@@ -82,7 +138,7 @@ async def query_documents(request: QueryRequest):
     
     start_time = time.time()
     
-    result = ai_agent.query(request.question, request.use_conversation)
+    result = await ai_agent.aquery(request.question, request.use_conversation)
     
     sources = []
     for doc in result.get("source_documents", []):
@@ -108,129 +164,42 @@ async def clear_memory():
     ai_agent.clear_memory()
     return {"message": "Conversation memory cleared"}
 
-@app.post("/sync/", response_model=SyncResponse)
-async def sync_upload_folder(background_tasks: BackgroundTasks = None):
+@app.post("/sync/", response_model=SyncTaskResponse)
+async def sync_upload_folder(background_tasks: BackgroundTasks):
     """
     Sync upload folder with vector store.
     Processes any new files added via FTP, copy-paste, or other methods.
-    """
-    start_time = time.time()
-    
-    upload_dir = Path(settings.UPLOAD_DIRECTORY)
-    tracking_file = Path(settings.UPLOAD_DIRECTORY) / ".processed_files.json"
-    
-    # Create upload directory if it doesn't exist
-    upload_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Load tracking data
-    processed_tracking = load_processed_files_tracking(tracking_file)
-    
-    # Scan upload directory for all supported files
-    supported_extensions = ['.pdf', '.txt', '.docx', '.doc', '.md', '.csv', '.json']
-    all_files = []
-    for ext in supported_extensions:
-        all_files.extend(upload_dir.glob(f"*{ext}"))
-    
-    # Filter out the tracking file
-    all_files = [f for f in all_files if f.name != ".processed_files.json"]
     
-    new_files = []
-    already_processed_files = []
-    failed_files = []
-    
-    # Identify new files
-    for file_path in all_files:
-        file_info = get_file_info(file_path)
-        if not is_file_processed(file_path, file_info, processed_tracking):
-            new_files.append(file_path)
-        else:
-            already_processed_files.append(file_path)
-    
-    processed_files = []
-    
-    # Process new files
-    if new_files:
-        try:
-            # Process documents
-            processor = LangChainDocumentProcessor()
-            splitter = AdvancedTextSplitter()
-            
-            for file_path in new_files:
-                try:
-                    # Load single file
-                    documents = processor._load_single_file(file_path)
-                    
-                    if documents:
-                        # Split documents
-                        split_documents = splitter.split_documents_by_type(documents)
-                        
-                        # Add to vector store
-                        vector_store_manager.add_documents(split_documents)
-                        
-                        # Track processed file
-                        file_info = get_file_info(file_path)
-                        processed_tracking[str(file_path)] = file_info
-                        processed_files.append(str(file_path.name))
-                    else:
-                        failed_files.append({
-                            "file": str(file_path.name),
-                            "error": "No documents extracted"
-                        })
-                except Exception as e:
-                    failed_files.append({
-                        "file": str(file_path.name),
-                        "error": str(e)
-                    })
-            
-            # Save tracking data
-            save_processed_files_tracking(tracking_file, processed_tracking)
-            
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error processing files: {str(e)}")
+    The sync runs in the background; poll /sync/{task_id} for the result.
+    """
+    task_id = uuid4().hex
+    sync_task_store.create(task_id)
     
-    processing_time = time.time() - start_time
+    background_tasks.add_task(run_sync_task, task_id)
     
-    return SyncResponse(
-        status="success",
-        total_files_in_folder=len(all_files),
-        new_files_processed=len(processed_files),
-        already_processed=len(already_processed_files),
-        failed=len(failed_files),
-        processed_files=processed_files,
-        failed_files=failed_files,
-        processing_time=processing_time
-    )
+    return SyncTaskResponse(task_id=task_id, status="queued")
 
 @app.get("/sync/status")
 async def get_sync_status():
     """
     Get current sync status - shows which files are processed and which are pending
     """
-    upload_dir = Path(settings.UPLOAD_DIRECTORY)
-    tracking_file = Path(settings.UPLOAD_DIRECTORY) / ".processed_files.json"
-    
-    # Load tracking data
-    processed_tracking = load_processed_files_tracking(tracking_file)
-    
     # Scan upload directory
-    supported_extensions = ['.pdf', '.txt', '.docx', '.doc', '.md', '.csv', '.json']
-    all_files = []
-    for ext in supported_extensions:
-        all_files.extend(upload_dir.glob(f"*{ext}"))
-    
-    all_files = [f for f in all_files if f.name != ".processed_files.json"]
+    all_entries = scan_upload_folder(UPLOAD_DIR)
     
     processed = []
     pending = []
     
-    for file_path in all_files:
-        file_info = get_file_info(file_path)
-        if is_file_processed(file_path, file_info, processed_tracking):
+    for entry in all_entries:
+        file_path = Path(entry.path)
+        file_info = get_file_info(entry)
+        tracked_info = processed_files_tracker.get(file_path)
+        if is_file_processed(file_info, tracked_info):
             processed.append({
                 "filename": file_path.name,
                 "size": file_info["size"],
                 "modified": file_info["modified"],
-                "processed_at": processed_tracking.get(str(file_path), {}).get("processed_at", "Unknown")
+                "processed_at": tracked_info.get("processed_at") or "Unknown"
             })
         else:
             pending.append({
@@ -240,13 +209,21 @@ async def get_sync_status():
             })
     
     return {
-        "total_files": len(all_files),
+        "total_files": len(all_entries),
         "processed_count": len(processed),
         "pending_count": len(pending),
         "processed_files": processed,
         "pending_files": pending
     }
 
+@app.get("/sync/{task_id}", response_model=SyncTaskResponse)
+async def get_sync_task(task_id: str):
+    """Get the state of a background sync started via POST /sync/"""
+    task = sync_task_store.get(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Unknown sync task")
+    return SyncTaskResponse(**task)
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -263,69 +240,176 @@ async def root():
 
 def process_documents(file_paths: List[str]):
     """Process documents and add to vector store"""
-    processor = LangChainDocumentProcessor()
-    splitter = AdvancedTextSplitter()
-    tracking_file = Path(settings.UPLOAD_DIRECTORY) / ".processed_files.json"
+    # Share the sync lock so an upload and a sync never embed the same file twice
+    with sync_lock:
+        # Parse the uploaded files in place
+        paths = [Path(file_path) for file_path in file_paths]
+        
+        documents = []
+        loaded_paths = []
+        for file_path, result in processor.load_files(paths).items():
+            if isinstance(result, Exception):
+                print(f"Error loading {file_path}: {result}")
+                continue
+            documents.extend(result)
+            loaded_paths.append(file_path)
+        
+        split_documents = splitter.split_documents_by_type(documents)
+        
+        vector_store_manager.add_documents(split_documents)
+        vector_store_manager.flush()
+        # Answers cached before these documents existed are now stale
+        ai_agent.clear_query_cache()
+        
+        # Track processed files
+        processed_files_tracker.mark_processed(
+            (file_path, get_file_info(file_path)) for file_path in loaded_paths
+        )
+
+def run_sync() -> SyncResponse:
+    """Process every new or modified file in the upload folder"""
+    start_time = time.time()
     
-    temp_dir = Path("./data/temp_processing")
-    temp_dir.mkdir(exist_ok=True)
+    # Create upload directory if it doesn't exist
+    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
     
-    for file_path in file_paths:
-        temp_path = temp_dir / Path(file_path).name
-        shutil.copy2(file_path, temp_path)
+    # Scan upload directory for all supported files
+    all_entries = scan_upload_folder(UPLOAD_DIR)
     
-    documents = processor.load_documents_from_folder(str(temp_dir))
-    split_documents = splitter.split_documents_by_type(documents)
+    new_files = {}
+    already_processed_files = []
+    failed_files = []
     
-    vector_store_manager.add_documents(split_documents)
+    # Identify new files, keeping the scanned info for tracking later
+    for entry in all_entries:
+        file_path = Path(entry.path)
+        file_info = get_file_info(entry)
+        if not processed_files_tracker.is_processed(file_path, file_info):
+            new_files[file_path] = file_info
+        else:
+            already_processed_files.append(file_path)
     
-    # Track processed files
-    processed_tracking = load_processed_files_tracking(tracking_file)
-    for file_path in file_paths:
-        file_info = get_file_info(Path(file_path))
-        processed_tracking[file_path] = file_info
-    save_processed_files_tracking(tracking_file, processed_tracking)
+    processed_files = []
     
-    for temp_file in temp_dir.glob("*"):
-        temp_file.unlink()
-    temp_dir.rmdir()
-
-# Helper functions for file tracking
-def load_processed_files_tracking(tracking_file: Path) -> Dict:
-    """Load the tracking data of processed files"""
-    if tracking_file.exists():
-        try:
-            with open(tracking_file, 'r') as f:
-                return json.load(f)
-        except Exception:
-            return {}
-    return {}
+    # Process new files
+    if new_files:
+        all_split_documents = []
+        loaded_files = []
+        
+        # Load files concurrently, then split them in order
+        loaded = processor.load_files(list(new_files))
+        
+        for file_path, documents in loaded.items():
+            if isinstance(documents, Exception):
+                failed_files.append({
+                    "file": str(file_path.name),
+                    "error": str(documents)
+                })
+                continue
+            
+            try:
+                if documents:
+                    # Split documents
+                    all_split_documents.extend(splitter.split_documents_by_type(documents))
+                    loaded_files.append(file_path)
+                else:
+                    failed_files.append({
+                        "file": str(file_path.name),
+                        "error": "No documents extracted"
+                    })
+            except Exception as e:
+                failed_files.append({
+                    "file": str(file_path.name),
+                    "error": str(e)
+                })
+        
+        # Add every file's chunks in one call so embeddings are batched
+        vector_store_manager.add_documents(all_split_documents)
+        vector_store_manager.flush()
+        # Answers cached before these documents existed are now stale
+        ai_agent.clear_query_cache()
+        
+        # Track processed files
+        processed_files_tracker.mark_processed(
+            (file_path, new_files[file_path]) for file_path in loaded_files
+        )
+        processed_files = [str(file_path.name) for file_path in loaded_files]
+    
+    processing_time = time.time() - start_time
+    
+    return SyncResponse(
+        status="success",
+        total_files_in_folder=len(all_entries),
+        new_files_processed=len(processed_files),
+        already_processed=len(already_processed_files),
+        failed=len(failed_files),
+        processed_files=processed_files,
+        failed_files=failed_files,
+        processing_time=processing_time
+    )
 
-def save_processed_files_tracking(tracking_file: Path, tracking_data: Dict):
-    """Save the tracking data of processed files"""
+def run_sync_task(task_id: str):
+    """Run a queued sync and record its outcome for polling"""
+    sync_task_store.update(task_id, "running")
     try:
-        with open(tracking_file, 'w') as f:
-            json.dump(tracking_data, f, indent=2)
+        # Serialize syncs so overlapping requests don't process a file twice
+        with sync_lock:
+            result = run_sync()
+        sync_task_store.update(task_id, "completed", result=result.model_dump())
     except Exception as e:
-        print(f"Error saving tracking data: {e}")
+        sync_task_store.update(task_id, "failed", error=f"Error processing files: {str(e)}")
+
+def copy_spooled_upload(source, file_path: Path):
+    """Copy a disk-backed upload without passing the bytes through Python"""
+    with open(file_path, "wb") as buffer:
+        # Only Linux sendfile() accepts a regular file as the destination
+        if sys.platform.startswith("linux"):
+            try:
+                source.flush()
+                in_fd = source.fileno()
+                size = os.fstat(in_fd).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(buffer.fileno(), in_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return
+            except OSError:
+                # Start over with a plain copy
+                buffer.seek(0)
+                buffer.truncate()
+        
+        source.seek(0)
+        shutil.copyfileobj(source, buffer, UPLOAD_CHUNK_SIZE)
 
-def get_file_info(file_path: Path) -> Dict:
-    """Get file metadata"""
+# Helper functions for file tracking
+def scan_upload_folder(upload_dir: Path) -> List[os.DirEntry]:
+    """List supported files in the upload folder with a single directory pass"""
+    if not upload_dir.exists():
+        return []
+    
+    with os.scandir(upload_dir) as entries:
+        return [
+            entry for entry in entries
+            if entry.is_file()
+            and os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS
+            and entry.name != LEGACY_TRACKING_FILENAME
+        ]
+
+def get_file_info(file_path: Union[Path, os.DirEntry]) -> Dict:
+    """Get file metadata (DirEntry.stat() reuses the scan's cached result)"""
     stat = file_path.stat()
     return {
         "size": stat.st_size,
-        "modified": stat.st_mtime,
-        "processed_at": datetime.now().isoformat()
+        "modified": stat.st_mtime
     }
 
-def is_file_processed(file_path: Path, current_info: Dict, tracking_data: Dict) -> bool:
+def is_file_processed(current_info: Dict, tracked_info: Optional[Dict]) -> bool:
     """Check if a file has been processed based on size and modification time"""
-    file_key = str(file_path)
-    if file_key not in tracking_data:
+    if tracked_info is None:
         return False
     
-    tracked_info = tracking_data[file_key]
-    
     # Check if file has been modified since last processing
     return (tracked_info.get("size") == current_info["size"] and 
             tracked_info.get("modified") == current_info["modified"])
\ No newline at end of file
@@ -2,12 +2,24 @@ from langchain_text_splitters import (
     RecursiveCharacterTextSplitter,
     CharacterTextSplitter,
     TokenTextSplitter,
-    MarkdownTextSplitter
+    MarkdownTextSplitter,
+    TextSplitter
 )
 from langchain_core.documents import Document
 from typing import List, Callable
 from pathlib import Path
-from config.settings import settings
+from functools import lru_cache
+from config.settings import settings, ChunkSizeUnit
+
+@lru_cache(maxsize=1)
+def _get_token_encoding():
+    """Load the tiktoken encoding once; get_encoding is expensive"""
+    import tiktoken
+    return tiktoken.get_encoding(settings.TOKEN_ENCODING)
+
+def _token_length(text: str) -> int:
+    """Length of text in tokens"""
+    return len(_get_token_encoding().encode_ordinary(text))
 
 class AdvancedTextSplitter:
     def __init__(self):
@@ -19,9 +31,23 @@ class AdvancedTextSplitter:
         }
         
         self.default_splitter = self._create_default_splitter()
+        self.markdown_splitter = MarkdownTextSplitter(
+            chunk_size=settings.CHUNK_SIZE,
+            chunk_overlap=settings.CHUNK_OVERLAP,
+            length_function=_token_length if settings.CHUNK_SIZE_UNIT == ChunkSizeUnit.TOKENS else len
+        )
     
-    def _create_default_splitter(self) -> RecursiveCharacterTextSplitter:
+    def _create_default_splitter(self) -> TextSplitter:
         """Create the default text splitter"""
+        if settings.CHUNK_SIZE_UNIT == ChunkSizeUnit.TOKENS:
+            # Tokenize each text once and slide a token window over it, instead
+            # of re-measuring every candidate piece of the recursive split
+            return TokenTextSplitter(
+                encoding_name=settings.TOKEN_ENCODING,
+                chunk_size=settings.CHUNK_SIZE,
+                chunk_overlap=settings.CHUNK_OVERLAP
+            )
+        
         return RecursiveCharacterTextSplitter(
             chunk_size=settings.CHUNK_SIZE,
             chunk_overlap=settings.CHUNK_OVERLAP,
@@ -45,21 +71,25 @@ class AdvancedTextSplitter:
     
     def split_documents_by_type(self, documents: List[Document]) -> List[Document]:
         """Intelligently split documents based on their type"""
-        split_docs = []
+        # Bucket by file type so each splitter runs once over its whole batch
+        markdown_docs = []
+        other_docs = []
         
         for doc in documents:
             source = doc.metadata.get('source', '')
-            file_extension = Path(source).suffix.lower()
-            
-            if file_extension == '.md':
-                # Use markdown-specific splitting
-                markdown_splitter = MarkdownTextSplitter(
-                    chunk_size=settings.CHUNK_SIZE,
-                    chunk_overlap=settings.CHUNK_OVERLAP
-                )
-                split_docs.extend(markdown_splitter.split_documents([doc]))
+            if Path(source).suffix.lower() == '.md':
+                markdown_docs.append(doc)
             else:
-                # Use default recursive splitting
-                split_docs.extend(self.default_splitter.split_documents([doc]))
+                other_docs.append(doc)
+        
+        split_docs = []
+        
+        if markdown_docs:
+            # Use markdown-specific splitting
+            split_docs.extend(self.markdown_splitter.split_documents(markdown_docs))
+        
+        if other_docs:
+            # Use default recursive splitting
+            split_docs.extend(self.default_splitter.split_documents(other_docs))
         
-        return split_docs
\ No newline at end of file
+        return split_docs
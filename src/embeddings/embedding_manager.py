@@ -3,9 +3,159 @@ from langchain_community.embeddings import (
     HuggingFaceEmbeddings,
     HuggingFaceInstructEmbeddings
 )
-from typing import Optional
+from langchain_classic.embeddings import CacheBackedEmbeddings
+from langchain_classic.storage import LocalFileStore
+from langchain_core.embeddings import Embeddings
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
 from config.settings import settings, EmbeddingProvider
+import numpy as np
 import os
+import threading
+import xxhash
+
+def _detect_device() -> str:
+    """Pick the fastest available torch device for sentence-transformers"""
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
+def _make_cache_key_encoder(namespace: str) -> Callable[[str], str]:
+    """Key embedding cache entries by a fast non-cryptographic content hash"""
+    def encode(text: str) -> str:
+        return f"{namespace}{xxhash.xxh3_128_hexdigest(text.encode('utf-8'))}"
+    return encode
+
+def _deduplicate(texts: List[str]) -> Tuple[List[str], List[int]]:
+    """Return the distinct texts and, for each input, its index among them"""
+    index_of = {}
+    unique_texts = []
+    positions = []
+    for text in texts:
+        if text not in index_of:
+            index_of[text] = len(unique_texts)
+            unique_texts.append(text)
+        positions.append(index_of[text])
+    return unique_texts, positions
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that keeps recent query vectors in memory and embeds
+    each distinct document text only once per call
+    """
+    
+    def __init__(self, underlying: Embeddings, maxsize: int = 1024):
+        self.underlying = underlying
+        # Tuples keep the cached vectors immutable and hashable
+        self._cached_query = lru_cache(maxsize=maxsize)(
+            lambda text: tuple(self.underlying.embed_query(text))
+        )
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        unique_texts, positions = _deduplicate(texts)
+        vectors = self.underlying.embed_documents(unique_texts)
+        return [vectors[i] for i in positions]
+    
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        unique_texts, positions = _deduplicate(texts)
+        vectors = await self.underlying.aembed_documents(unique_texts)
+        return [vectors[i] for i in positions]
+    
+    def embed_query(self, text: str) -> List[float]:
+        return list(self._cached_query(text))
+
+class FuzzyEmbeddingCache(Embeddings):
+    """
+    Reuses the embedding of a previously seen, near-identical chunk
+    
+    Chunks are sketched with MinHash over word 5-grams and looked up in an LSH
+    index; LSH only yields candidates, so a vector is reused only when the
+    estimated Jaccard similarity to the candidate's stored sketch reaches the
+    threshold. The index lives in memory and keeps the most recent
+    ``max_entries`` chunks.
+    """
+    
+    def __init__(
+        self,
+        underlying: Embeddings,
+        threshold: float = 0.9,
+        num_perm: int = 64,
+        max_entries: int = 20000
+    ):
+        from datasketch import MinHashLSH
+        
+        self.underlying = underlying
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.max_entries = max_entries
+        self._lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
+        # key -> (sketch, float32 vector), oldest first
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _sketch(self, text: str):
+        from datasketch import MinHash
+        
+        words = text.split()
+        shingles = {
+            " ".join(words[i:i + 5]).encode("utf-8")
+            for i in range(max(1, len(words) - 4))
+        }
+        sketch = MinHash(num_perm=self.num_perm)
+        sketch.update_batch(list(shingles))
+        return sketch
+    
+    def _lookup(self, sketch) -> Optional[np.ndarray]:
+        """Return the stored vector of the most similar candidate above the threshold"""
+        best_vector, best_similarity = None, self.threshold
+        for key in self._lsh.query(sketch):
+            stored_sketch, vector = self._entries[key]
+            similarity = sketch.jaccard(stored_sketch)
+            if similarity >= best_similarity:
+                best_vector, best_similarity = vector, similarity
+        return best_vector
+    
+    def _store(self, key: str, sketch, vector: List[float]) -> None:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return
+        self._lsh.insert(key, sketch)
+        self._entries[key] = (sketch, np.asarray(vector, dtype=np.float32))
+        while len(self._entries) > self.max_entries:
+            oldest, _ = self._entries.popitem(last=False)
+            self._lsh.remove(oldest)
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
+        misses = []
+        
+        with self._lock:
+            for i, text in enumerate(texts):
+                sketch = self._sketch(text)
+                match = self._lookup(sketch)
+                if match is not None:
+                    vectors[i] = match.tolist()
+                else:
+                    misses.append((i, text, sketch))
+        
+        if misses:
+            embedded = self.underlying.embed_documents([text for _, text, _ in misses])
+            with self._lock:
+                for (i, text, sketch), vector in zip(misses, embedded):
+                    vectors[i] = vector
+                    self._store(xxhash.xxh3_128_hexdigest(text.encode("utf-8")), sketch, vector)
+        
+        return vectors
+    
+    def embed_query(self, text: str) -> List[float]:
+        return self.underlying.embed_query(text)
 
 class EmbeddingManager:
     def __init__(self):
@@ -28,8 +178,8 @@ class EmbeddingManager:
         elif provider == EmbeddingProvider.HUGGINGFACE:
             self.embedding_model = HuggingFaceEmbeddings(
                 model_name=settings.EMBEDDING_MODEL,
-                model_kwargs={'device': 'cpu'},
-                encode_kwargs={'normalize_embeddings': True}
+                model_kwargs={'device': settings.EMBEDDING_DEVICE or _detect_device()},
+                encode_kwargs={'normalize_embeddings': True, 'batch_size': 64}
             )
         
         elif provider == EmbeddingProvider.LOCAL:
@@ -38,6 +188,26 @@ class EmbeddingManager:
                 cache_folder="./models"
             )
     
+        # Near-duplicate chunks can reuse an existing vector when enabled; it sits
+        # beneath the exact cache so only exact-cache misses are looked up
+        if settings.EMBEDDING_FUZZY_CACHE_THRESHOLD:
+            self.embedding_model = FuzzyEmbeddingCache(
+                self.embedding_model,
+                threshold=settings.EMBEDDING_FUZZY_CACHE_THRESHOLD
+            )
+        
+        # Persist document embeddings so unchanged chunks are never re-embedded;
+        # the model name namespaces the keys so switching models invalidates them
+        self.cache = LocalFileStore(settings.EMBEDDING_CACHE_DIRECTORY)
+        self.embedding_model = CacheBackedEmbeddings.from_bytes_store(
+            self.embedding_model,
+            self.cache,
+            key_encoder=_make_cache_key_encoder(settings.EMBEDDING_MODEL)
+        )
+        
+        # Repeat questions and duplicate chunks skip the model forward pass
+        self.embedding_model = CachedEmbeddings(self.embedding_model)
+    
     def get_embeddings(self):
         """Get the embedding model"""
         return self.embedding_model
\ No newline at end of file
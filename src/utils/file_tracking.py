@@ -0,0 +1,99 @@
+"""
+SQLite-backed record of which uploaded files have been processed
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+from loguru import logger
+
+
+class ProcessedFilesTracker:
+    """Tracks processed files by path, size and modification time"""
+    
+    def __init__(self, db_path: Union[str, Path], legacy_json_path: Optional[Path] = None):
+        """
+        Args:
+            db_path: SQLite database file to store tracking rows in
+            legacy_json_path: Old .processed_files.json to import on first use
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Shared between the event loop and background threads, guarded by a lock
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._lock = threading.Lock()
+        
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS processed_files ("
+                "path TEXT PRIMARY KEY, size INTEGER, modified REAL, processed_at TEXT)"
+            )
+        
+        if legacy_json_path is not None:
+            self._import_legacy_json(Path(legacy_json_path))
+    
+    def _import_legacy_json(self, json_path: Path):
+        """Carry over entries from the old JSON tracking file into an empty table"""
+        if not json_path.exists():
+            return
+        
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM processed_files LIMIT 1").fetchone():
+                return
+        
+        try:
+            with open(json_path, 'r') as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error(f"Error reading legacy tracking file {json_path}: {e}")
+            return
+        
+        rows = [
+            (path, info.get("size"), info.get("modified"), info.get("processed_at"))
+            for path, info in data.items()
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO processed_files VALUES (?, ?, ?, ?)", rows
+            )
+        logger.info(f"Imported {len(rows)} entries from {json_path}")
+    
+    def get(self, file_path: Union[str, Path]) -> Optional[Dict]:
+        """Return the tracking entry for a file, if any"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, modified, processed_at FROM processed_files WHERE path = ?",
+                (str(file_path),)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"size": row[0], "modified": row[1], "processed_at": row[2]}
+    
+    def is_processed(self, file_path: Union[str, Path], file_info: Dict) -> bool:
+        """Check if a file was processed with its current size and modification time"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM processed_files WHERE path = ? AND size = ? AND modified = ?",
+                (str(file_path), file_info["size"], file_info["modified"])
+            ).fetchone()
+        return row is not None
+    
+    def mark_processed(self, files: Iterable[Tuple[Union[str, Path], Dict]]):
+        """Record files (with their size/modified info) as processed now"""
+        processed_at = datetime.now().isoformat()
+        rows = [
+            (str(file_path), info["size"], info["modified"], processed_at)
+            for file_path, info in files
+        ]
+        if not rows:
+            return
+        
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO processed_files VALUES (?, ?, ?, ?)", rows
+            )
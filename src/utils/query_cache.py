@@ -0,0 +1,87 @@
+"""
+Small in-process LRU cache for stateless agent queries
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Hashable, Optional
+
+
+class QueryCache:
+    """LRU cache with a per-entry time-to-live"""
+    
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        """
+        Args:
+            maxsize: Maximum number of cached results
+            ttl: Seconds a cached result stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        with self._lock:
+            self._entries.clear()
+
+
+def cached_query(func):
+    """
+    Cache an agent's query/aquery results on self._query_cache.
+    
+    Conversational queries depend on memory state and always bypass the cache.
+    """
+    def cache_key(question: str, use_conversation: bool) -> tuple:
+        return hashlib.sha1(question.encode("utf-8")).hexdigest(), use_conversation
+    
+    if asyncio.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(self, question: str, use_conversation: bool = False):
+            if use_conversation:
+                return await func(self, question, use_conversation)
+            key = cache_key(question, use_conversation)
+            result = self._query_cache.get(key)
+            if result is None:
+                result = await func(self, question, use_conversation)
+                self._query_cache.put(key, result)
+            return result
+        return async_wrapper
+    
+    @wraps(func)
+    def wrapper(self, question: str, use_conversation: bool = False):
+        if use_conversation:
+            return func(self, question, use_conversation)
+        key = cache_key(question, use_conversation)
+        result = self._query_cache.get(key)
+        if result is None:
+            result = func(self, question, use_conversation)
+            self._query_cache.put(key, result)
+        return result
+    return wrapper
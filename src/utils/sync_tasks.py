@@ -0,0 +1,79 @@
+"""
+SQLite-backed state of background sync tasks, shared by all API workers
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+class SyncTaskStore:
+    """Records the status and outcome of each background sync by task id"""
+    
+    def __init__(self, db_path: Union[str, Path], max_tasks: int = 100):
+        """
+        Args:
+            db_path: SQLite database file to store task rows in
+            max_tasks: Number of most recent tasks to keep
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_tasks = max_tasks
+        
+        # Shared between the event loop and background threads, guarded by a lock;
+        # other worker processes reach the same rows through the database file
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._lock = threading.Lock()
+        
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_tasks ("
+                "task_id TEXT PRIMARY KEY, status TEXT, result TEXT, error TEXT, created_at TEXT)"
+            )
+    
+    def create(self, task_id: str):
+        """Record a new queued task, dropping the oldest beyond max_tasks"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO sync_tasks VALUES (?, 'queued', NULL, NULL, ?)",
+                (task_id, datetime.now().isoformat())
+            )
+            self._conn.execute(
+                "DELETE FROM sync_tasks WHERE task_id NOT IN ("
+                "SELECT task_id FROM sync_tasks ORDER BY created_at DESC LIMIT ?)",
+                (self.max_tasks,)
+            )
+    
+    def update(
+        self,
+        task_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ):
+        """Set a task's status, and its result or error once finished"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE sync_tasks SET status = ?, result = ?, error = ? WHERE task_id = ?",
+                (status, json.dumps(result) if result is not None else None, error, task_id)
+            )
+    
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Return a task's state, or None if it is unknown or was pruned"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, result, error FROM sync_tasks WHERE task_id = ?",
+                (task_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "task_id": task_id,
+            "status": row[0],
+            "result": json.loads(row[1]) if row[1] is not None else None,
+            "error": row[2]
+        }
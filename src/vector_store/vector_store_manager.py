@@ -1,7 +1,9 @@
 from langchain_community.vectorstores import Chroma, FAISS
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from types import SimpleNamespace
 from config.settings import settings
 import os
 
@@ -42,28 +44,70 @@ class VectorStoreManager:
                 self.vector_store = None
                 print("FAISS vector store will be created when documents are added")
     
-    def add_documents(self, documents: List[Document]) -> None:
-        """Add documents to vector store"""
+    def add_documents(self, documents: List[Document], batch_size: int = 100) -> None:
+        """Add documents to vector store in embedding-sized batches"""
         if not documents:
             print("No documents to add")
             return
         
+        batches = [documents[i:i + batch_size] for i in range(0, len(documents), batch_size)]
+        
         if settings.VECTOR_STORE == "chroma":
-            self.vector_store.add_documents(documents)
+            for batch in batches:
+                self.vector_store.add_documents(batch)
             print(f"Added {len(documents)} documents to Chroma vector store")
         
         elif settings.VECTOR_STORE == "faiss":
-            if self.vector_store is None:
-                self.vector_store = FAISS.from_documents(
-                    documents, 
-                    self.embedding_model
-                )
-            else:
-                self.vector_store.add_documents(documents)
+            for batch in batches:
+                if self.vector_store is None:
+                    self.vector_store = self._create_faiss_store(batch)
+                else:
+                    self.vector_store.add_documents(batch)
             
+            print(f"Added {len(documents)} documents to FAISS vector store (call flush() to persist)")
+    
+    def _create_faiss_store(self, documents: List[Document]) -> FAISS:
+        """Create a FAISS store, optionally backed by an 8-bit scalar quantized index"""
+        if not settings.FAISS_SCALAR_QUANTIZATION:
+            return FAISS.from_documents(documents, self.embedding_model)
+        
+        import faiss
+        import numpy as np
+        
+        texts = [doc.page_content for doc in documents]
+        embeddings = np.asarray(self.embedding_model.embed_documents(texts), dtype="float32")
+        
+        # int8 codes take a quarter of the memory of float32 vectors. The
+        # per-dimension ranges are fixed at train time and saved with the index,
+        # so always cover [-1, 1] (normalized embeddings) rather than trusting a
+        # first batch that may hold a single chunk
+        dimension = embeddings.shape[1]
+        bounds = np.array([[-1.0] * dimension, [1.0] * dimension], dtype="float32")
+        index = faiss.IndexScalarQuantizer(
+            dimension,
+            faiss.ScalarQuantizer.QT_8bit,
+            faiss.METRIC_L2
+        )
+        index.train(np.vstack([bounds, embeddings]))
+        
+        store = FAISS(
+            embedding_function=self.embedding_model,
+            index=index,
+            docstore=InMemoryDocstore(),
+            index_to_docstore_id={}
+        )
+        store.add_embeddings(
+            list(zip(texts, embeddings.tolist())),
+            metadatas=[doc.metadata for doc in documents]
+        )
+        return store
+    
+    def flush(self) -> None:
+        """Persist pending changes; call once after a batch of add_documents calls"""
+        # Chroma persists its own writes; FAISS must be saved explicitly
+        if settings.VECTOR_STORE == "faiss" and self.vector_store is not None:
             faiss_path = os.path.join(settings.PERSIST_DIRECTORY, "faiss_index")
             self.vector_store.save_local(faiss_path)
-            print(f"Added {len(documents)} documents to FAISS vector store")
     
     def similarity_search(self, query: str, k: int = 4, **kwargs) -> List[Document]:
         """Perform similarity search"""
@@ -72,6 +116,14 @@ class VectorStoreManager:
         
         return self.vector_store.similarity_search(query, k=k, **kwargs)
     
+    def similarity_search_columns(self, query: str, k: int = 4, **kwargs) -> SimpleNamespace:
+        """Perform similarity search, returning parallel contents/metadatas lists"""
+        docs = self.similarity_search(query, k=k, **kwargs)
+        return SimpleNamespace(
+            contents=[doc.page_content for doc in docs],
+            metadatas=[doc.metadata for doc in docs]
+        )
+    
     def similarity_search_with_score(self, query: str, k: int = 4) -> List[tuple]:
         """Perform similarity search with scores"""
         if self.vector_store is None:
@@ -79,6 +131,38 @@ class VectorStoreManager:
         
         return self.vector_store.similarity_search_with_score(query, k=k)
     
+    def get_document_ids(self) -> List[str]:
+        """Return the ids of the documents in the vector store without their contents"""
+        if self.vector_store is None:
+            return []
+        
+        if settings.VECTOR_STORE == "chroma":
+            return list(self.vector_store.get(include=[])["ids"])
+        
+        elif settings.VECTOR_STORE == "faiss":
+            return list(self.vector_store.docstore._dict.keys())
+        
+        return []
+    
+    def get_all_documents(self) -> Tuple[List[str], List[Document]]:
+        """Return the ids and documents currently held in the vector store"""
+        if self.vector_store is None:
+            return [], []
+        
+        if settings.VECTOR_STORE == "chroma":
+            data = self.vector_store.get(include=["documents", "metadatas"])
+            documents = [
+                Document(page_content=text, metadata=metadata or {})
+                for text, metadata in zip(data["documents"], data["metadatas"])
+            ]
+            return list(data["ids"]), documents
+        
+        elif settings.VECTOR_STORE == "faiss":
+            stored = self.vector_store.docstore._dict
+            return list(stored.keys()), list(stored.values())
+        
+        return [], []
+    
     def as_retriever(self, **kwargs):
         """Get vector store as retriever"""
         if self.vector_store is None:
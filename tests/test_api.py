@@ -0,0 +1,71 @@
+import pytest
+from typing import List
+from fastapi.testclient import TestClient
+from langchain_core.embeddings import Embeddings
+from config.settings import settings
+from src.embeddings import embedding_manager
+
+class ConstantEmbeddings(Embeddings):
+    def __init__(self, **kwargs):
+        pass
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [[1.0, 0.0] for _ in texts]
+    
+    def embed_query(self, text: str) -> List[float]:
+        return [1.0, 0.0]
+
+@pytest.fixture(scope="module")
+def api(tmp_path_factory):
+    """Import the API against temporary directories and a stand-in embedding model"""
+    data_dir = tmp_path_factory.mktemp("data")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(embedding_manager, "HuggingFaceEmbeddings", ConstantEmbeddings)
+        mp.setattr(settings, "EMBEDDING_PROVIDER", "huggingface")
+        mp.setattr(settings, "EMBEDDING_DEVICE", "cpu")
+        mp.setattr(settings, "EMBEDDING_FUZZY_CACHE_THRESHOLD", None)
+        mp.setattr(settings, "EMBEDDING_CACHE_DIRECTORY", str(data_dir / "emb_cache"))
+        mp.setattr(settings, "VECTOR_STORE", "chroma")
+        mp.setattr(settings, "PERSIST_DIRECTORY", str(data_dir / "vector_store"))
+        mp.setattr(settings, "UPLOAD_DIRECTORY", str(data_dir / "uploads"))
+        mp.setenv("OPENAI_API_KEY", "sk-test")
+        
+        from src.api import main
+        yield main
+
+class TestUpload:
+    def test_small_and_spooled_uploads_saved_and_tracked(self, api, monkeypatch):
+        """Test in-memory and disk-spooled uploads are both written, processed and tracked"""
+        copied = []
+        copy_spooled_upload = api.copy_spooled_upload
+        
+        def spy(source, file_path):
+            copied.append(file_path.name)
+            copy_spooled_upload(source, file_path)
+        
+        monkeypatch.setattr(api, "copy_spooled_upload", spy)
+        small = b"small upload text"
+        large = b"spooled upload text\n" * (api.UPLOAD_SPOOL_MAX_SIZE // 10)
+        
+        with TestClient(api.app) as client:
+            response = client.post("/upload/", files=[
+                ("files", ("small.txt", small, "text/plain")),
+                ("files", ("large.txt", large, "text/plain")),
+            ])
+        
+        assert response.status_code == 200
+        assert copied == ["large.txt"]
+        assert (api.UPLOAD_DIR / "small.txt").read_bytes() == small
+        assert (api.UPLOAD_DIR / "large.txt").read_bytes() == large
+        assert api.processed_files_tracker.get(api.UPLOAD_DIR / "small.txt") is not None
+        assert api.processed_files_tracker.get(api.UPLOAD_DIR / "large.txt") is not None
+    
+    def test_upload_clears_cached_answers(self, api):
+        """Test answers cached before an upload are not served afterwards"""
+        api.ai_agent._query_cache.put("question", {"answer": "I don't know"})
+        
+        with TestClient(api.app) as client:
+            response = client.post("/upload/", files=[("files", ("new.txt", b"new facts", "text/plain"))])
+        
+        assert response.status_code == 200
+        assert api.ai_agent._query_cache.get("question") is None
@@ -29,4 +29,31 @@ class TestDocumentProcessor:
             f.write("test content")
         
         documents = self.processor.load_documents_from_folder(self.test_dir)
-        assert len(documents) == 0
\ No newline at end of file
+        assert len(documents) == 0
+    
+    def test_load_files_keeps_order_and_errors(self):
+        """Test concurrent loading preserves input order and reports failures"""
+        paths = []
+        for name in ["b.txt", "a.txt", "c.txt"]:
+            path = Path(self.test_dir) / name
+            path.write_text(f"content of {name}")
+            paths.append(path)
+        missing = Path(self.test_dir) / "missing.txt"
+        
+        results = self.processor.load_files(paths + [missing])
+        
+        assert list(results) == paths + [missing]
+        assert "content of b.txt" in results[paths[0]][0].page_content
+        assert isinstance(results[missing], Exception)
+    
+    def test_hidden_directories_skipped(self):
+        """Test files inside hidden directories are not loaded"""
+        hidden_dir = Path(self.test_dir) / ".git"
+        hidden_dir.mkdir()
+        (hidden_dir / "ignored.txt").write_text("hidden content")
+        (Path(self.test_dir) / "visible.txt").write_text("visible content")
+        
+        documents = self.processor.load_documents_from_folder(self.test_dir)
+        
+        assert len(documents) == 1
+        assert "visible content" in documents[0].page_content
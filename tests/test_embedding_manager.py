@@ -0,0 +1,145 @@
+from typing import List
+from langchain_core.embeddings import Embeddings
+from config.settings import settings
+from src.embeddings import embedding_manager
+from src.embeddings.embedding_manager import (
+    CachedEmbeddings,
+    EmbeddingManager,
+    FuzzyEmbeddingCache,
+    _make_cache_key_encoder
+)
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self, **kwargs):
+        self.document_calls = []
+        self.query_calls = []
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.document_calls.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+    
+    def embed_query(self, text: str) -> List[float]:
+        self.query_calls.append(text)
+        return [float(len(text)), 1.0]
+
+class TestEmbeddingManager:
+    def test_document_embeddings_persist_on_disk(self, monkeypatch, tmp_path):
+        """Test a second manager reads unchanged chunks from the disk cache"""
+        models = []
+        
+        def make_model(**kwargs):
+            models.append(CountingEmbeddings())
+            return models[-1]
+        
+        monkeypatch.setattr(embedding_manager, "HuggingFaceEmbeddings", make_model)
+        monkeypatch.setattr(settings, "EMBEDDING_PROVIDER", "huggingface")
+        monkeypatch.setattr(settings, "EMBEDDING_DEVICE", "cpu")
+        monkeypatch.setattr(settings, "EMBEDDING_CACHE_DIRECTORY", str(tmp_path))
+        monkeypatch.setattr(settings, "EMBEDDING_FUZZY_CACHE_THRESHOLD", None)
+        
+        first = EmbeddingManager().get_embeddings()
+        assert first.embed_documents(["alpha", "beta"]) == [[5.0, 1.0], [4.0, 1.0]]
+        
+        second = EmbeddingManager().get_embeddings()
+        assert second.embed_documents(["alpha", "beta"]) == [[5.0, 1.0], [4.0, 1.0]]
+        assert models[0].document_calls == [["alpha", "beta"]]
+        assert models[1].document_calls == []
+    
+    def test_exact_cache_consulted_before_fuzzy_cache(self, monkeypatch, tmp_path):
+        """Test a chunk already on disk keeps its own vector over a near-duplicate's"""
+        models = []
+        
+        def make_model(**kwargs):
+            models.append(CountingEmbeddings())
+            return models[-1]
+        
+        monkeypatch.setattr(embedding_manager, "HuggingFaceEmbeddings", make_model)
+        monkeypatch.setattr(settings, "EMBEDDING_PROVIDER", "huggingface")
+        monkeypatch.setattr(settings, "EMBEDDING_DEVICE", "cpu")
+        monkeypatch.setattr(settings, "EMBEDDING_CACHE_DIRECTORY", str(tmp_path))
+        words = [f"word{i}" for i in range(150)]
+        original = " ".join(words)
+        edited = " ".join(words[:-1] + ["edit"])
+        
+        monkeypatch.setattr(settings, "EMBEDDING_FUZZY_CACHE_THRESHOLD", None)
+        edited_vector = EmbeddingManager().get_embeddings().embed_documents([edited])[0]
+        
+        monkeypatch.setattr(settings, "EMBEDDING_FUZZY_CACHE_THRESHOLD", 0.9)
+        fuzzy = EmbeddingManager().get_embeddings()
+        original_vector = fuzzy.embed_documents([original])[0]
+        
+        assert original_vector != edited_vector
+        assert fuzzy.embed_documents([edited]) == [edited_vector]
+        assert models[1].document_calls == [[original]]
+
+
+class TestCachedEmbeddings:
+    def test_cache_key_encoder(self):
+        """Test cache keys are namespaced, stable and content-sensitive"""
+        encode = _make_cache_key_encoder("model-a")
+        key = encode("some chunk text")
+        assert key.startswith("model-a")
+        assert key == encode("some chunk text")
+        assert key != encode("other chunk text")
+        assert key != _make_cache_key_encoder("model-b")("some chunk text")
+        assert encode("caf\u00e9") != encode("cafe")
+    
+    def test_duplicate_texts_embedded_once(self):
+        """Test repeated chunk texts share one model call and keep their order"""
+        underlying = CountingEmbeddings()
+        embeddings = CachedEmbeddings(underlying)
+        
+        vectors = embeddings.embed_documents(["aa", "b", "aa"])
+        
+        assert vectors == [[2.0, 1.0], [1.0, 1.0], [2.0, 1.0]]
+        assert underlying.document_calls == [["aa", "b"]]
+    
+    def test_repeat_query_memoized(self):
+        """Test a repeated question is embedded only once"""
+        underlying = CountingEmbeddings()
+        embeddings = CachedEmbeddings(underlying)
+        
+        assert embeddings.embed_query("hello") == [5.0, 1.0]
+        assert embeddings.embed_query("hello") == [5.0, 1.0]
+        assert underlying.query_calls == ["hello"]
+
+
+class TestFuzzyEmbeddingCache:
+    def setup_method(self):
+        self.words = [f"word{i}" for i in range(150)]
+        self.text = " ".join(self.words)
+    
+    def test_near_duplicate_reuses_vector(self):
+        """Test a one-word edit reuses the original chunk's vector"""
+        underlying = CountingEmbeddings()
+        cache = FuzzyEmbeddingCache(underlying)
+        edited = " ".join(self.words[:-1] + ["changed"])
+        
+        original_vector = cache.embed_documents([self.text])[0]
+        
+        assert cache.embed_documents([edited]) == [original_vector]
+        assert underlying.document_calls == [[self.text]]
+    
+    def test_dissimilar_candidate_not_reused(self):
+        """Test an LSH candidate below the Jaccard threshold is embedded afresh"""
+        underlying = CountingEmbeddings()
+        cache = FuzzyEmbeddingCache(underlying)
+        cache.embed_documents([self.text])
+        # Surface every stored chunk as a candidate, as an LSH false positive would
+        cache._lsh.query = lambda sketch: list(cache._entries)
+        other = " ".join(f"other{i}" for i in range(150))
+        
+        cache.embed_documents([other])
+        
+        assert underlying.document_calls == [[self.text], [other]]
+    
+    def test_oldest_entries_evicted(self):
+        """Test the cache keeps at most max_entries chunks"""
+        cache = FuzzyEmbeddingCache(CountingEmbeddings(), max_entries=2)
+        texts = [" ".join(f"{n}-{i}" for i in range(20)) for n in "abc"]
+        
+        cache.embed_documents(texts)
+        
+        assert len(cache._entries) == 2
+        assert cache._lookup(cache._sketch(texts[0])) is None
+        assert cache._lookup(cache._sketch(texts[2])) is not None
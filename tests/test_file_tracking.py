@@ -0,0 +1,32 @@
+import json
+import tempfile
+from pathlib import Path
+from src.utils.file_tracking import ProcessedFilesTracker
+
+class TestProcessedFilesTracker:
+    def setup_method(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.tracker = ProcessedFilesTracker(self.test_dir / "tracking.db")
+    
+    def test_mark_and_check_processed(self):
+        """Test a recorded file counts as processed until it changes"""
+        info = {"size": 10, "modified": 1700000000.123456}
+        assert not self.tracker.is_processed("a.txt", info)
+        
+        self.tracker.mark_processed([("a.txt", info)])
+        
+        assert self.tracker.is_processed("a.txt", info)
+        assert not self.tracker.is_processed("a.txt", {"size": 11, "modified": info["modified"]})
+        assert self.tracker.get("a.txt")["processed_at"]
+    
+    def test_imports_legacy_json(self):
+        """Test entries from the old JSON tracking file are carried over"""
+        legacy = self.test_dir / "legacy.json"
+        legacy.write_text(json.dumps({
+            "b.txt": {"size": 5, "modified": 1.5, "processed_at": "2024-01-01T00:00:00"}
+        }))
+        
+        tracker = ProcessedFilesTracker(self.test_dir / "migrated.db", legacy_json_path=legacy)
+        
+        assert tracker.is_processed("b.txt", {"size": 5, "modified": 1.5})
+        assert tracker.get("b.txt")["processed_at"] == "2024-01-01T00:00:00"
@@ -0,0 +1,45 @@
+import time
+from src.utils.query_cache import QueryCache, cached_query
+
+class CountingAgent:
+    def __init__(self):
+        self.calls = 0
+        self._query_cache = QueryCache(maxsize=2)
+    
+    @cached_query
+    def query(self, question: str, use_conversation: bool = False):
+        self.calls += 1
+        return {"answer": question.upper()}
+
+class TestQueryCache:
+    def test_repeat_query_is_cached(self):
+        """Test identical stateless questions hit the cache"""
+        agent = CountingAgent()
+        assert agent.query("hello") == {"answer": "HELLO"}
+        assert agent.query("hello") == {"answer": "HELLO"}
+        assert agent.calls == 1
+    
+    def test_conversation_bypasses_cache(self):
+        """Test conversational queries are never cached"""
+        agent = CountingAgent()
+        agent.query("hello", use_conversation=True)
+        agent.query("hello", use_conversation=True)
+        assert agent.calls == 2
+    
+    def test_lru_eviction_and_clear(self):
+        """Test the oldest entry is evicted and clear() empties the cache"""
+        cache = QueryCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+        assert cache.get("a") is None
+        assert cache.get("c") == 3
+        cache.clear()
+        assert cache.get("c") is None
+    
+    def test_entries_expire(self):
+        """Test entries older than the TTL are dropped"""
+        cache = QueryCache(ttl=0.01)
+        cache.put("a", 1)
+        time.sleep(0.02)
+        assert cache.get("a") is None
@@ -0,0 +1,37 @@
+import pytest
+from pydantic import ValidationError
+from config.settings import ChunkSizeUnit, Settings, get_settings
+
+class TestSettings:
+    def test_settings_validated_once(self, monkeypatch):
+        """Test repeated access reuses the cached, already-validated instance"""
+        calls = []
+        original_init = Settings.__init__
+        
+        def counting_init(self, *args, **kwargs):
+            calls.append(1)
+            original_init(self, *args, **kwargs)
+        
+        monkeypatch.setattr(Settings, "__init__", counting_init)
+        get_settings.cache_clear()
+        try:
+            assert get_settings() is get_settings()
+            assert len(calls) == 1
+        finally:
+            get_settings.cache_clear()
+    
+    def test_api_key_resolved_on_access(self, monkeypatch):
+        """Test secrets are read from the environment on first access"""
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        instance = Settings()
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        assert instance.ANTHROPIC_API_KEY == "test-key"
+    
+    def test_chunk_size_unit_validated(self, monkeypatch):
+        """Test the chunk size unit accepts known values and rejects typos"""
+        monkeypatch.setenv("CHUNK_SIZE_UNIT", "tokens")
+        assert Settings().CHUNK_SIZE_UNIT == ChunkSizeUnit.TOKENS
+        
+        monkeypatch.setenv("CHUNK_SIZE_UNIT", "token")
+        with pytest.raises(ValidationError):
+            Settings()
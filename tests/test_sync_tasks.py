@@ -0,0 +1,32 @@
+import tempfile
+from pathlib import Path
+from src.utils.sync_tasks import SyncTaskStore
+
+class TestSyncTaskStore:
+    def setup_method(self):
+        self.db_path = Path(tempfile.mkdtemp()) / "tracking.db"
+        self.store = SyncTaskStore(self.db_path, max_tasks=2)
+    
+    def test_task_lifecycle_visible_to_other_connections(self):
+        """Test a task's outcome can be read through a separate store on the same file"""
+        self.store.create("t1")
+        assert self.store.get("t1")["status"] == "queued"
+        
+        self.store.update("t1", "completed", result={"status": "success", "failed": 0})
+        
+        task = SyncTaskStore(self.db_path).get("t1")
+        assert task["status"] == "completed"
+        assert task["result"] == {"status": "success", "failed": 0}
+        assert task["error"] is None
+    
+    def test_oldest_tasks_pruned(self):
+        """Test only the most recent max_tasks tasks are kept"""
+        for task_id in ["t1", "t2", "t3"]:
+            self.store.create(task_id)
+        
+        assert self.store.get("t1") is None
+        assert self.store.get("t3")["status"] == "queued"
+    
+    def test_unknown_task(self):
+        """Test an unknown task id returns None"""
+        assert self.store.get("missing") is None
@@ -0,0 +1,23 @@
+from langchain_core.documents import Document
+from src.core.text_splitter import AdvancedTextSplitter
+
+class TestAdvancedTextSplitter:
+    def setup_method(self):
+        self.splitter = AdvancedTextSplitter()
+    
+    def test_split_by_type_keeps_metadata(self):
+        """Test mixed markdown and text documents are split with their sources intact"""
+        documents = [
+            Document(page_content="# Title\n\n" + "markdown text " * 300, metadata={"source": "notes.md"}),
+            Document(page_content="plain text " * 300, metadata={"source": "notes.txt"}),
+        ]
+        
+        chunks = self.splitter.split_documents_by_type(documents)
+        
+        sources = {chunk.metadata["source"] for chunk in chunks}
+        assert sources == {"notes.md", "notes.txt"}
+        assert len(chunks) > 2
+    
+    def test_split_by_type_empty(self):
+        """Test splitting no documents returns no chunks"""
+        assert self.splitter.split_documents_by_type([]) == []
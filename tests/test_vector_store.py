@@ -0,0 +1,50 @@
+import numpy as np
+import xxhash
+from typing import List
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from config.settings import settings
+from src.vector_store.vector_store_manager import VectorStoreManager
+
+class RandomUnitEmbeddings(Embeddings):
+    """Deterministic pseudo-random unit vectors keyed by the text"""
+    
+    def _embed(self, text: str) -> List[float]:
+        rng = np.random.default_rng(xxhash.xxh64_intdigest(text.encode("utf-8")))
+        vector = rng.standard_normal(64)
+        return (vector / np.linalg.norm(vector)).tolist()
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed(text) for text in texts]
+    
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed(text)
+
+class TestVectorStoreManager:
+    def test_quantized_index_from_single_chunk(self, monkeypatch, tmp_path):
+        """Test an SQ8 index seeded by a one-chunk batch still finds later chunks"""
+        monkeypatch.setattr(settings, "VECTOR_STORE", "faiss")
+        monkeypatch.setattr(settings, "PERSIST_DIRECTORY", str(tmp_path))
+        monkeypatch.setattr(settings, "FAISS_SCALAR_QUANTIZATION", True)
+        manager = VectorStoreManager(RandomUnitEmbeddings())
+        
+        manager.add_documents([Document(page_content="first chunk")])
+        texts = [f"chunk number {i}" for i in range(50)]
+        manager.add_documents([Document(page_content=text) for text in texts])
+        
+        hits = [manager.similarity_search(text, k=1)[0].page_content for text in texts]
+        assert hits == texts
+    
+    def test_document_ids_match_stored_documents(self, monkeypatch, tmp_path):
+        """Test ids can be listed without loading the documents themselves"""
+        monkeypatch.setattr(settings, "VECTOR_STORE", "faiss")
+        monkeypatch.setattr(settings, "PERSIST_DIRECTORY", str(tmp_path))
+        monkeypatch.setattr(settings, "FAISS_SCALAR_QUANTIZATION", False)
+        manager = VectorStoreManager(RandomUnitEmbeddings())
+        assert manager.get_document_ids() == []
+        
+        manager.add_documents([Document(page_content=text) for text in ["a", "b"]])
+        
+        doc_ids, documents = manager.get_all_documents()
+        assert manager.get_document_ids() == doc_ids
+        assert [doc.page_content for doc in documents] == ["a", "b"]